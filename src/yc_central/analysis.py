@@ -2,7 +2,106 @@
 
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
+from numba import njit
+
+
+@njit(cache=True)
+def _add_observation(moments: np.ndarray, count: int, x: float, y: float):
+    """Welford update of [mean_x, mean_y, M2_x, M2_y, C_xy] after (x, y) joins, giving `count` observations."""
+    dx = x - moments[0]
+    dy = y - moments[1]
+    moments[0] += dx / count
+    moments[1] += dy / count
+    moments[2] += dx * (x - moments[0])
+    moments[3] += dy * (y - moments[1])
+    moments[4] += dx * (y - moments[1])
+
+
+@njit(cache=True)
+def _remove_observation(moments: np.ndarray, count: int, x: float, y: float):
+    """Undo _add_observation: (x, y) leaves a window that held `count` observations."""
+    dx = x - moments[0]
+    dy = y - moments[1]
+    moments[0] -= dx / (count - 1)
+    moments[1] -= dy / (count - 1)
+    moments[2] -= dx * (x - moments[0])
+    moments[3] -= dy * (y - moments[1])
+    moments[4] -= dx * (y - moments[1])
+
+
+@njit(cache=True)
+def _rolling_ols(x: np.ndarray, y: np.ndarray, window: int):
+    """Fit y = intercept + slope * x over each window by sliding centred moments one step at a time."""
+    # inputs and outputs are float32; the moments are updated in float64 from deviations about the running mean,
+    # so neither storage precision nor the level of the series limits how small a variance can be resolved
+    slopes = np.full(max(len(x) - window + 1, 0), np.nan, dtype=np.float32)
+    intercepts = np.full(len(slopes), np.nan, dtype=np.float32)
+    moments = np.zeros(5)
+    run = 0
+    for i, xi in enumerate(x):
+        if i >= window:
+            _remove_observation(moments, window, np.float64(x[i - window]), np.float64(y[i - window]))
+        _add_observation(moments, min(i + 1, window), np.float64(xi), np.float64(y[i]))
+        # length of the run of equal regressor values ending here; a constant regressor has no defined slope
+        run = run + 1 if i > 0 and xi == x[i - 1] else 1
+        if i >= window - 1 and run < window and moments[2] > 0:
+            slope = moments[4] / moments[2]
+            slopes[i - window + 1] = slope
+            intercepts[i - window + 1] = moments[1] - slope * moments[0]
+    return slopes, intercepts
+
+
+@njit(cache=True)
+def _rolling_corr(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """Pearson correlation of x and y over each window from sliding centred moments; inputs must not contain NaN."""
+    assert not (np.isnan(x).any() or np.isnan(y).any())
+    corr = np.full(len(x), np.nan, dtype=np.float32)
+    moments = np.zeros(5)
+    run_x = run_y = 0
+    for i, xi in enumerate(x):
+        if i >= window:
+            _remove_observation(moments, window, np.float64(x[i - window]), np.float64(y[i - window]))
+        _add_observation(moments, min(i + 1, window), np.float64(xi), np.float64(y[i]))
+        run_x = run_x + 1 if i > 0 and xi == x[i - 1] else 1
+        run_y = run_y + 1 if i > 0 and y[i] == y[i - 1] else 1
+        # correlation is undefined when either series is constant over the window
+        if i >= window - 1 and run_x < window and run_y < window and moments[2] > 0 and moments[3] > 0:
+            corr[i] = moments[4] / np.sqrt(moments[2] * moments[3])
+    return corr
+
+
+@njit(cache=True)
+def _rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Sample standard deviation of x over each window from sliding centred moments; x must not contain NaN."""
+    assert not np.isnan(x).any()
+    std = np.full(len(x), np.nan, dtype=np.float32)
+    moments = np.zeros(5)
+    run = 0
+    for i, xi in enumerate(x):
+        if i >= window:
+            xk = np.float64(x[i - window])
+            _remove_observation(moments, window, xk, xk)
+        _add_observation(moments, min(i + 1, window), np.float64(xi), np.float64(xi))
+        run = run + 1 if i > 0 and xi == x[i - 1] else 1
+        if i >= window - 1:
+            # report exactly zero for constant windows rather than leftover rounding
+            std[i] = np.sqrt(max(moments[2], 0.0) / (window - 1)) if run < window else 0.0
+    return std
+
+
+def _ffill(x: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs in a 1-D array; NaNs before the first valid value are kept."""
+    idx = np.where(np.isnan(x), 0, np.arange(len(x)))
+    np.maximum.accumulate(idx, out=idx)
+    return x[idx]
+
+
+def _leading_nans(*arrays: np.ndarray) -> int:
+    """Count the leading positions where any of the forward-filled arrays is still NaN."""
+    missing = np.zeros(len(arrays[0]), dtype=bool)
+    for arr in arrays:
+        missing |= np.isnan(arr)
+    return len(missing) if missing.all() else int(np.argmin(missing))
 
 
 def calculate_yield_inversion(
@@ -24,12 +123,13 @@ def calculate_yield_inversion(
         pd.DataFrame: DataFrame with Date and Yield_Curve_Inversion columns.
 
     """
-    inversion_diff = df[long_term] - df[short_term]
+    # read the yield columns as views of the shared panel instead of allocating intermediate Series
+    inversion_diff = df[long_term].to_numpy() - df[short_term].to_numpy()
     return pd.DataFrame(
         {
             "Date": df["Date"].values,
             f"{long_term}-{short_term}_Spread": inversion_diff,
-            f"{long_term}-{short_term}_Inversion": np.where(inversion_diff < 0, 1, 0),
+            f"{long_term}-{short_term}_Inversion": (inversion_diff < 0).astype(np.int8),
         }
     )
 
@@ -38,7 +138,7 @@ def rolling_regression_coefficients(
     df: pd.DataFrame,
     dependent_var: str,
     independent_var: str,
-    window: int = 2,
+    window: int = 14,
 ) -> pd.DataFrame:
     """
     Perform rolling window regression and return rolling coefficients.
@@ -52,31 +152,27 @@ def rolling_regression_coefficients(
 
     Returns
     -------
-        pd.DataFrame: DataFrame with Date, Slope, and Intercept columns.
+        pd.DataFrame: DataFrame with Date, Slope, and Intercept columns. Windows in which the independent
+            variable is constant have NaN Slope and Intercept.
 
     """
-    df = df[[dependent_var, independent_var]].ffill().reset_index(drop=True).dropna()
-    slopes = []
-    intercepts = []
-    window = 14
-
-    for i in range(len(df) - window + 1):
-        window_data = df.iloc[i : i + window]
-        X = window_data[independent_var].values.reshape(-1, 1)
-        y = window_data[dependent_var].values
-        model = LinearRegression()
-        model.fit(X, y)
-        slopes.append(model.coef_[0])
-        intercepts.append(model.intercept_)
-
-    rolling_dates = df["Date"].dropna().reset_index(drop=True)[window - 1 :]
-
+    if window < 2:
+        raise ValueError("Rolling window size must be at least 2.")
+    # forward-fill the two columns as arrays, after which only a leading run of rows can still be missing
+    x = _ffill(df[independent_var].to_numpy(dtype=np.float32))
+    y = _ffill(df[dependent_var].to_numpy(dtype=np.float32))
+    start = _leading_nans(x, y)
+    slopes, intercepts = _rolling_ols(x[start:], y[start:], window)
+
+    # the kernel already fills preallocated float32 arrays, so hand them to pandas without another copy;
+    # only the dates are copied so the result doesn't alias the caller's (possibly cached) frame
     regression_df = pd.DataFrame(
         {
-            "Date": rolling_dates,
+            "Date": df["Date"].to_numpy()[start + window - 1 :].copy(),
             "Slope": slopes,
             "Intercept": intercepts,
-        }
+        },
+        copy=False,
     )
     return regression_df
 
@@ -90,6 +186,8 @@ def calculate_rolling_correlation(
     """
     Calculate rolling correlation between two specified series.
 
+    Missing observations are forward-filled before the rolling window is applied.
+
     Args
     ----
         df (pd.DataFrame): Dataframe of historical data to analyze.
@@ -102,5 +200,43 @@ def calculate_rolling_correlation(
         pd.DataFrame: DataFrame with Date and Rolling_Correlation columns.
 
     """
-    rolling_corr = df[series_id_1].rolling(window=window).corr(df[series_id_2])
+    if window < 2:
+        raise ValueError("Rolling window size must be at least 2.")
+    # forward-fill once so the kernel runs without per-element NaN checks
+    x = _ffill(df[series_id_1].to_numpy(dtype=np.float32))
+    y = _ffill(df[series_id_2].to_numpy(dtype=np.float32))
+    start = _leading_nans(x, y)
+    rolling_corr = np.full(len(x), np.nan, dtype=np.float32)
+    rolling_corr[start:] = _rolling_corr(x[start:], y[start:], window)
     return pd.DataFrame({"Date": df["Date"].values, f"{series_id_1}_{series_id_2}_Rolling_Correlation": rolling_corr})
+
+
+def calculate_rolling_volatility(
+    df: pd.DataFrame,
+    series_id: str,
+    window: int = 30,
+) -> pd.DataFrame:
+    """
+    Calculate rolling volatility (sample standard deviation) of a specified series.
+
+    Missing observations are forward-filled before the rolling window is applied.
+
+    Args
+    ----
+        df (pd.DataFrame): Dataframe of historical data to analyze.
+        series_id (str): Series ID to analyze.
+        window (int): Rolling window size.
+
+    Returns
+    -------
+        pd.DataFrame: DataFrame with Date and Rolling_Volatility columns.
+
+    """
+    if window < 2:
+        raise ValueError("Rolling window size must be at least 2.")
+    # forward-fill once so the kernel runs without per-element NaN checks
+    x = _ffill(df[series_id].to_numpy(dtype=np.float32))
+    start = _leading_nans(x)
+    rolling_vol = np.full(len(x), np.nan, dtype=np.float32)
+    rolling_vol[start:] = _rolling_std(x[start:], window)
+    return pd.DataFrame({"Date": df["Date"].values, f"{series_id}_Rolling_Volatility": rolling_vol})
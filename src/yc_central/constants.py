@@ -1,23 +1,49 @@
 """Constant variable values used in historical data API class."""
 
 import datetime
+from enum import Enum
 
-TODAY = datetime.datetime.today()
-ONE_MONTH_PREV = TODAY - datetime.timedelta(30)
-ONE_YEAR_PREV = TODAY - datetime.timedelta(365)
-
-SERIES = {
-    "DTB4WK": "4-Week Treasury Bill Secondary Market Rate, Discount Basis",
-    "DGS3MO": "Market Yield on U.S. Treasury Securities at 3-Month Constant Maturity, Quoted on an Investment Basis",
-    "DGS6MO": "Market Yield on U.S. Treasury Securities at 6-Month Constant Maturity, Quoted on an Investment Basis",
-    "DGS1": "Market Yield on U.S. Treasury Securities at 1-Year Constant Maturity, Quoted on an Investment Basis",
-    "DGS2": "Market Yield on U.S. Treasury Securities at 2-Year Constant Maturity, Quoted on an Investment Basis",
-    "DGS5": "Market Yield on U.S. Treasury Securities at 5-Year Constant Maturity, Quoted on an Investment Basis",
-    "DGS7": "Market Yield on U.S. Treasury Securities at 7-Year Constant Maturity, Quoted on an Investment Basis",
-    "DGS10": "Market Yield on U.S. Treasury Securities at 10-Year Constant Maturity, Quoted on an Investment Basis",
-    "DGS30": "Market Yield on U.S. Treasury Securities at 30-Year Constant Maturity, Quoted on an Investment Basis",
-    "T10Y3M": "10-Year Treasury Constant Maturity Minus 3-Month Treasury Constant Maturity",
-    "T10Y2Y": "10-Year Treasury Constant Maturity Minus 2-Year Treasury Constant Maturity",
-    "SP500": "S&P 500",
-    "VIXCLS": "CBOE Volatility Index: VIX",
-}
+
+def today() -> datetime.date:
+    """Return the current date, evaluated at call time so long-running processes don't go stale."""
+    return datetime.date.today()
+
+
+def one_month_prev() -> datetime.date:
+    """Return the date 30 days before today."""
+    return today() - datetime.timedelta(30)
+
+
+def one_year_prev() -> datetime.date:
+    """Return the date 365 days before today."""
+    return today() - datetime.timedelta(365)
+
+
+class Frequency(str, Enum):
+    """Observation frequencies accepted by the FRED API."""
+
+    DAILY = "d"
+    WEEKLY = "w"
+    BIWEEKLY = "bw"
+    MONTHLY = "m"
+    QUARTERLY = "q"
+    SEMIANNUAL = "sa"
+    ANNUAL = "a"
+
+
+SERIES = (
+    ("DTB4WK", "4-Week Treasury Bill Secondary Market Rate, Discount Basis"),
+    ("DGS3MO", "Market Yield on U.S. Treasury Securities at 3-Month Constant Maturity, Quoted on an Investment Basis"),
+    ("DGS6MO", "Market Yield on U.S. Treasury Securities at 6-Month Constant Maturity, Quoted on an Investment Basis"),
+    ("DGS1", "Market Yield on U.S. Treasury Securities at 1-Year Constant Maturity, Quoted on an Investment Basis"),
+    ("DGS2", "Market Yield on U.S. Treasury Securities at 2-Year Constant Maturity, Quoted on an Investment Basis"),
+    ("DGS5", "Market Yield on U.S. Treasury Securities at 5-Year Constant Maturity, Quoted on an Investment Basis"),
+    ("DGS7", "Market Yield on U.S. Treasury Securities at 7-Year Constant Maturity, Quoted on an Investment Basis"),
+    ("DGS10", "Market Yield on U.S. Treasury Securities at 10-Year Constant Maturity, Quoted on an Investment Basis"),
+    ("DGS30", "Market Yield on U.S. Treasury Securities at 30-Year Constant Maturity, Quoted on an Investment Basis"),
+    ("T10Y3M", "10-Year Treasury Constant Maturity Minus 3-Month Treasury Constant Maturity"),
+    ("T10Y2Y", "10-Year Treasury Constant Maturity Minus 2-Year Treasury Constant Maturity"),
+    ("SP500", "S&P 500"),
+    ("VIXCLS", "CBOE Volatility Index: VIX"),
+)
+SERIES_IDS = tuple(series_id for series_id, _ in SERIES)
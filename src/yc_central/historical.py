@@ -1,17 +1,23 @@
 """API class to fetch yield curve data from AlphaVantage endpoints."""
 
 import datetime
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 from fredapi import Fred
 
 from yc_central.constants import (
-    ONE_MONTH_PREV,
-    SERIES,
-    TODAY,
+    SERIES_IDS,
+    Frequency,
+    one_month_prev,
+    today,
 )
 
+_VALID_FREQUENCIES = frozenset(frequency.value for frequency in Frequency)
+
 
 class HistoricalFredDataAPI:
     """
@@ -26,12 +32,14 @@ class HistoricalFredDataAPI:
     def __init__(self, fred_api_key):
         self.api_key = fred_api_key
         self.fred = Fred(api_key=fred_api_key)
+        # memoize joined yield series per instance so repeated analyses don't refetch from FRED
+        self._get_all_yield_series_cached = lru_cache(maxsize=8)(self._fetch_all_yield_series)
 
     def get_single_series(
         self,
         fred_series_name: str = "SP500",
-        observation_start: datetime.datetime = ONE_MONTH_PREV,
-        observation_end: datetime.datetime = TODAY,
+        observation_start: Optional[datetime.date] = None,
+        observation_end: Optional[datetime.date] = None,
         frequency: str = "d",
     ) -> pd.DataFrame:
         """
@@ -40,16 +48,36 @@ class HistoricalFredDataAPI:
         Args
         ----
             :fred_series_name str: Name of data series to retrieve.
-            :observation_start datetime.datetime: Start date of data retrieval.
-            :observation_end datetime.datetime: End date of data retrieval.
-            :frequency str: Frequency to retrieve data (daily, weekly, monthly).
+            :observation_start datetime.date: Start date of data retrieval, defaults to one month ago.
+            :observation_end datetime.date: End date of data retrieval, defaults to today.
+            :frequency str | Frequency: Frequency to retrieve data (daily, weekly, monthly).
 
         Returns
         -------
             :pd.DataFrame: Pandas DataFrame object of historical data.
 
         """
-        if frequency not in {"d", "w", "bw", "m", "q", "sa", "a"}:
+        data = self._get_series(
+            fred_series_name=fred_series_name,
+            observation_start=observation_start or one_month_prev(),
+            observation_end=observation_end or today(),
+            frequency=frequency,
+        )
+        # return data in pd.DataFrame object instead of pd.Series
+        return pd.DataFrame({"Date": data.index, fred_series_name: data.values})
+
+    def _get_series(
+        self,
+        fred_series_name: str,
+        observation_start: datetime.date,
+        observation_end: datetime.date,
+        frequency: str,
+    ) -> pd.Series:
+        """Retrieve a data series from FRED API as a pd.Series named after the series and indexed by Date."""
+        # Frequency members are valid by construction, only plain strings need checking
+        if isinstance(frequency, Frequency):
+            frequency = frequency.value
+        elif frequency not in _VALID_FREQUENCIES:
             raise ValueError('Interval value must be one of: "d", "w", "bw", "m", "q", "sa", "a"')
         try:
             # fetch historical data series from FRED
@@ -59,16 +87,20 @@ class HistoricalFredDataAPI:
                 observation_end=observation_end,
                 frequency=frequency,
             )
-            # return data in pd.DataFrame object instead of pd.Series
-            return pd.DataFrame({"Date": data.index, fred_series_name: data.values})
+            # yields carry at most a few significant digits, so float32 loses nothing and halves memory traffic
+            return pd.Series(
+                data.values.astype(np.float32, copy=False),
+                index=pd.DatetimeIndex(data.index, name="Date"),
+                name=fred_series_name,
+            )
         # raise error if a series is unavailable
         except Exception as e:
             raise ValueError(f"Could not retrieve series {fred_series_name}.\n\n{e}")
 
     def get_all_yield_series(
         self,
-        observation_start: datetime.datetime = ONE_MONTH_PREV,
-        observation_end: datetime.datetime = TODAY,
+        observation_start: Optional[datetime.date] = None,
+        observation_end: Optional[datetime.date] = None,
         frequency: str = "d",
     ) -> pd.DataFrame:
         """
@@ -76,26 +108,44 @@ class HistoricalFredDataAPI:
 
         Args
         ----
-            :observation_start datetime.datetime: Start date of data retrieval.
-            :observation_end datetime.datetime: End date of data retrieval.
-            :frequency str: Frequency to retrieve data (daily, weekly, monthly).
+            :observation_start datetime.date: Start date of data retrieval, defaults to one month ago.
+            :observation_end datetime.date: End date of data retrieval, defaults to today.
+            :frequency str | Frequency: Frequency to retrieve data (daily, weekly, monthly).
 
         Returns
         -------
             :pd.DataFrame: Pandas DataFrame object of historical data series joined together.
 
         """
-        # retrieve data for series in yc_central.constants.SERIES
-        dfs = []
-        for series_name in SERIES:
-            dfs.append(
-                self.get_single_series(
-                    fred_series_name=series_name,
-                    observation_start=observation_start,
-                    observation_end=observation_end,
-                    frequency=frequency,
+        # resolve default dates before the cache lookup so calls on the same day share an entry
+        cached = self._get_all_yield_series_cached(
+            observation_start or one_month_prev(),
+            observation_end or today(),
+            frequency,
+        )
+        # a shallow copy shares the column buffers but keeps caller changes out of the cache
+        return cached.copy(deep=False)
+
+    def _fetch_all_yield_series(
+        self,
+        observation_start: datetime.date,
+        observation_end: datetime.date,
+        frequency: str,
+    ) -> pd.DataFrame:
+        """Fetch data series from constants.SERIES from FRED API and join them on Date."""
+        # retrieve data for series in yc_central.constants.SERIES concurrently, fredapi calls are blocking
+        with ThreadPoolExecutor(max_workers=len(SERIES_IDS)) as executor:
+            series = list(
+                executor.map(
+                    lambda series_name: self._get_series(
+                        fred_series_name=series_name,
+                        observation_start=observation_start,
+                        observation_end=observation_end,
+                        frequency=frequency,
+                    ),
+                    SERIES_IDS,
                 )
             )
-        # merge the individual dataframes together and return
-        merged_dfs = reduce(lambda left, right: pd.merge(left, right, on="Date", how="left"), dfs)
+        # join the individual series on Date in one pass, keeping the dates of the first series
+        merged_dfs = pd.concat(series, axis=1, join="outer").reindex(series[0].index).reset_index()
         return merged_dfs
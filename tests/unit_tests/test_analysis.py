@@ -0,0 +1,205 @@
+"""Unit tests for yc_central.analysis."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from yc_central.analysis import (
+    calculate_rolling_correlation,
+    calculate_rolling_volatility,
+    rolling_regression_coefficients,
+)
+
+
+def _make_df(n: int = 200, x_level: float = 4.0, x_scale: float = 0.05, y_level: float = 4.5, seed: int = 0):
+    """Build a frame of two float32 random walks shaped like the joined FRED panel."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "Date": pd.date_range("2020-01-01", periods=n),
+            "X": (x_level + rng.normal(0, x_scale, n).cumsum()).astype(np.float32),
+            "Y": (y_level + rng.normal(0, 0.05, n).cumsum()).astype(np.float32),
+        }
+    )
+
+
+def _polyfit_reference(df: pd.DataFrame, window: int) -> pd.DataFrame:
+    """Fit each window of the forward-filled data with np.polyfit in float64, NaN where X is constant."""
+    df = df.ffill().dropna().reset_index(drop=True)
+    x = df["X"].to_numpy(dtype=np.float64)
+    y = df["Y"].to_numpy(dtype=np.float64)
+    coefs = [
+        np.polyfit(x[i : i + window], y[i : i + window], 1) if np.ptp(x[i : i + window]) > 0 else (np.nan, np.nan)
+        for i in range(len(df) - window + 1)
+    ]
+    return pd.DataFrame(
+        {
+            "Date": df["Date"].values[window - 1 :],
+            "Slope": [slope for slope, _ in coefs],
+            "Intercept": [intercept for _, intercept in coefs],
+        }
+    )
+
+
+def _assert_matches_reference(result: pd.DataFrame, expected: pd.DataFrame):
+    assert list(result.columns) == ["Date", "Slope", "Intercept"]
+    assert len(result) == len(expected)
+    np.testing.assert_array_equal(result["Date"].values, expected["Date"].values)
+    np.testing.assert_allclose(result["Slope"], expected["Slope"], rtol=1e-4, atol=1e-5)
+    np.testing.assert_allclose(result["Intercept"], expected["Intercept"], rtol=1e-4, atol=1e-4)
+
+
+def test__rolling_regression_coefficients__matches_polyfit():
+    """Rolling slopes and intercepts match an independent per-window least squares fit."""
+    df = _make_df()
+    result = rolling_regression_coefficients(df, "Y", "X", window=14)
+    _assert_matches_reference(result, _polyfit_reference(df, 14))
+
+
+def test__rolling_regression_coefficients__leading_nans_and_gaps():
+    """Leading NaNs are dropped and interior gaps are forward-filled before fitting."""
+    df = _make_df()
+    df.loc[:4, "X"] = np.nan
+    df.loc[:2, "Y"] = np.nan
+    df.loc[[40, 41, 42, 90], "X"] = np.nan
+    df.loc[[60, 120], "Y"] = np.nan
+    result = rolling_regression_coefficients(df, "Y", "X", window=14)
+    assert result["Date"].iloc[0] == df["Date"].iloc[5 + 13]
+    _assert_matches_reference(result, _polyfit_reference(df, 14))
+
+
+def test__rolling_regression_coefficients__constant_regressor():
+    """Windows in which the regressor is constant yield NaN instead of raising or returning noise."""
+    df = _make_df()
+    df.loc[50:99, "X"] = np.float32(0.02)
+    result = rolling_regression_coefficients(df, "Y", "X", window=14)
+    constant = result["Date"].between(df["Date"].iloc[50 + 13], df["Date"].iloc[99])
+    assert constant.sum() == 50 - 13
+    assert result.loc[constant, ["Slope", "Intercept"]].isna().all().all()
+    assert result.loc[~constant, ["Slope", "Intercept"]].notna().all().all()
+    _assert_matches_reference(result, _polyfit_reference(df, 14))
+
+
+def test__rolling_regression_coefficients__sp500_scale_regressor():
+    """Large-magnitude regressors keep full precision despite float32 storage."""
+    df = _make_df(x_level=4000.0, x_scale=20.0, y_level=20.0)
+    result = rolling_regression_coefficients(df, "Y", "X", window=14)
+    _assert_matches_reference(result, _polyfit_reference(df, 14))
+
+
+def test__rolling_regression_coefficients__small_moves_at_high_level():
+    """A high-level regressor with small moves still has a defined slope in every window."""
+    df = _make_df(x_level=4000.0, x_scale=0.01)
+    result = rolling_regression_coefficients(df, "Y", "X", window=30)
+    assert result[["Slope", "Intercept"]].notna().all().all()
+    _assert_matches_reference(result, _polyfit_reference(df, 30))
+
+
+def test__rolling_regression_coefficients__window_longer_than_data():
+    """A window longer than the data yields an empty frame."""
+    result = rolling_regression_coefficients(_make_df(n=10), "Y", "X", window=14)
+    assert list(result.columns) == ["Date", "Slope", "Intercept"]
+    assert result.empty
+
+
+@pytest.mark.parametrize("window", [0, 1])
+def test__rolling_regression_coefficients__rejects_small_window(window):
+    """Windows too small to fit a line are rejected up front."""
+    with pytest.raises(ValueError):
+        rolling_regression_coefficients(_make_df(), "Y", "X", window=window)
+
+
+def _with_gaps(df: pd.DataFrame) -> pd.DataFrame:
+    """Blank out a leading run and a few interior observations of both series."""
+    df = df.copy()
+    df.loc[:4, "X"] = np.nan
+    df.loc[:7, "Y"] = np.nan
+    df.loc[[40, 41, 90], "X"] = np.nan
+    df.loc[[60, 150], "Y"] = np.nan
+    return df
+
+
+def test__calculate_rolling_volatility__matches_pandas():
+    """Rolling volatility matches pandas' rolling std of the forward-filled series."""
+    df = _with_gaps(_make_df())
+    result = calculate_rolling_volatility(df, "X", window=30)
+    expected = df["X"].astype(np.float64).ffill().rolling(30).std()
+    assert list(result.columns) == ["Date", "X_Rolling_Volatility"]
+    np.testing.assert_array_equal(result["Date"].values, df["Date"].values)
+    assert result["X_Rolling_Volatility"].isna().sum() == 5 + 29
+    np.testing.assert_allclose(result["X_Rolling_Volatility"], expected, rtol=1e-4, atol=1e-6)
+
+
+def test__calculate_rolling_volatility__constant_window():
+    """Constant windows have zero volatility."""
+    df = _make_df()
+    df.loc[50:99, "X"] = np.float32(4.37)
+    result = calculate_rolling_volatility(df, "X", window=30)
+    expected = df["X"].astype(np.float64).rolling(30).std()
+    assert (result["X_Rolling_Volatility"].iloc[50 + 29 : 100] == 0).all()
+    np.testing.assert_allclose(result["X_Rolling_Volatility"], expected, rtol=1e-4, atol=1e-6)
+
+
+def test__calculate_rolling_volatility__small_moves_at_high_level():
+    """A high-level series with small moves keeps its small but non-zero volatility."""
+    df = _make_df(x_level=4000.0, x_scale=0.01)
+    result = calculate_rolling_volatility(df, "X", window=30)
+    expected = df["X"].astype(np.float64).rolling(30).std()
+    assert (result["X_Rolling_Volatility"].iloc[29:] > 0).all()
+    np.testing.assert_allclose(result["X_Rolling_Volatility"], expected, rtol=1e-4, atol=1e-6)
+
+
+def test__calculate_rolling_volatility__all_nan():
+    """A series with no observations yields NaN everywhere."""
+    df = _make_df(n=50)
+    df["X"] = np.nan
+    result = calculate_rolling_volatility(df, "X", window=10)
+    assert len(result) == 50
+    assert result["X_Rolling_Volatility"].isna().all()
+
+
+@pytest.mark.parametrize("window", [0, 1])
+def test__calculate_rolling_volatility__rejects_small_window(window):
+    """Windows too small for a sample standard deviation are rejected up front."""
+    with pytest.raises(ValueError):
+        calculate_rolling_volatility(_make_df(), "X", window=window)
+
+
+def test__calculate_rolling_correlation__matches_pandas():
+    """Rolling correlation matches pandas' rolling corr of the forward-filled series."""
+    df = _with_gaps(_make_df())
+    result = calculate_rolling_correlation(df, "X", "Y", window=30)
+    expected = df["X"].astype(np.float64).ffill().rolling(30).corr(df["Y"].astype(np.float64).ffill())
+    assert list(result.columns) == ["Date", "X_Y_Rolling_Correlation"]
+    np.testing.assert_array_equal(result["Date"].values, df["Date"].values)
+    assert result["X_Y_Rolling_Correlation"].isna().sum() == 8 + 29
+    np.testing.assert_allclose(result["X_Y_Rolling_Correlation"], expected, rtol=1e-4, atol=1e-5)
+
+
+def test__calculate_rolling_correlation__constant_window():
+    """Correlation is NaN over windows in which either series is constant."""
+    df = _make_df()
+    df.loc[50:99, "X"] = np.float32(4.37)
+    result = calculate_rolling_correlation(df, "X", "Y", window=30)
+    corr = result["X_Y_Rolling_Correlation"]
+    assert corr.iloc[50 + 29 : 100].isna().all()
+    # pandas reports +/-inf or noise on constant windows, so only compare the rest
+    expected = df["X"].astype(np.float64).rolling(30).corr(df["Y"].astype(np.float64))
+    varying = np.r_[29 : 50 + 29, 100 : len(df)]
+    np.testing.assert_allclose(corr.iloc[varying], expected.iloc[varying], rtol=1e-4, atol=1e-5)
+
+
+def test__calculate_rolling_correlation__all_nan_prefix():
+    """If one series never has an observation, every window is NaN."""
+    df = _make_df(n=50)
+    df["Y"] = np.nan
+    result = calculate_rolling_correlation(df, "X", "Y", window=10)
+    assert len(result) == 50
+    assert result["X_Y_Rolling_Correlation"].isna().all()
+
+
+@pytest.mark.parametrize("window", [-5, -1, 0, 1])
+def test__calculate_rolling_correlation__rejects_small_window(window):
+    """Windows too small for a correlation are rejected up front."""
+    with pytest.raises(ValueError):
+        calculate_rolling_correlation(_make_df(), "X", "Y", window=window)
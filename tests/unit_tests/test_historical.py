@@ -0,0 +1,106 @@
+"""Unit tests for yc_central.historical."""
+
+import datetime
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from yc_central.constants import SERIES_IDS
+from yc_central.historical import HistoricalFredDataAPI
+
+DATES = pd.date_range("2024-01-01", periods=5)
+
+
+class _StubFred:
+    """Stand-in for fredapi.Fred that serves canned series and records every request."""
+
+    def __init__(self, series):
+        self.series = series
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_series(self, series_id, observation_start, observation_end, frequency):
+        with self._lock:
+            self.calls.append((series_id, observation_start, observation_end, frequency))
+        return self.series[series_id]
+
+
+@pytest.fixture
+def stub_fred():
+    """Serve the same five days for every series, except SP500 which skips one and adds another."""
+    series = {
+        series_id: pd.Series(np.arange(len(DATES), dtype=np.float64) + i, index=DATES)
+        for i, series_id in enumerate(SERIES_IDS)
+    }
+    # SP500 skips a day present in the first series and reports one the first series doesn't have
+    sp500_dates = DATES.drop(DATES[2]).append(pd.DatetimeIndex([DATES[-1] + pd.Timedelta(days=1)]))
+    series["SP500"] = pd.Series(np.arange(len(sp500_dates), dtype=np.float64) * 100, index=sp500_dates)
+    return _StubFred(series)
+
+
+@pytest.fixture
+def api(stub_fred):
+    """Build a HistoricalFredDataAPI that talks to the stub instead of FRED."""
+    api = HistoricalFredDataAPI(fred_api_key="test-key")
+    api.fred = stub_fred
+    return api
+
+
+def test__get_all_yield_series__joins_on_first_series_dates(api):
+    """Series are joined left onto the first series' dates, in SERIES order."""
+    df = api.get_all_yield_series(datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+    assert list(df.columns) == ["Date", *SERIES_IDS]
+    np.testing.assert_array_equal(df["Date"].values, DATES.values)
+    np.testing.assert_array_equal(df[SERIES_IDS[0]].values, np.arange(len(DATES), dtype=np.float32))
+    np.testing.assert_array_equal(df["SP500"].values, [0.0, 100.0, np.nan, 200.0, 300.0])
+    assert (df[list(SERIES_IDS)].dtypes == np.float32).all()
+
+
+def test__get_all_yield_series__fetches_every_series_once(api, stub_fred):
+    """Each series is requested once with the given range and frequency."""
+    start, end = datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)
+    api.get_all_yield_series(start, end, frequency="w")
+    assert sorted(call[0] for call in stub_fred.calls) == sorted(SERIES_IDS)
+    assert {call[1:] for call in stub_fred.calls} == {(start, end, "w")}
+
+
+def test__get_all_yield_series__caches_repeated_calls(api, stub_fred):
+    """Repeating a call with the same arguments is served from the cache."""
+    start, end = datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)
+    first = api.get_all_yield_series(start, end)
+    second = api.get_all_yield_series(start, end)
+    assert len(stub_fred.calls) == len(SERIES_IDS)
+    pd.testing.assert_frame_equal(second, first)
+
+    api.get_all_yield_series(start, datetime.date(2024, 2, 29))
+    assert len(stub_fred.calls) == 2 * len(SERIES_IDS)
+
+
+def test__get_all_yield_series__mutations_do_not_leak_into_cache(api):
+    """Changing a returned frame does not change what later calls return."""
+    start, end = datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)
+    df = api.get_all_yield_series(start, end)
+    expected = df.copy()
+    df["Spread"] = df["DGS10"] - df["DGS2"]
+    df.dropna(inplace=True)
+    df.drop(columns="DGS10", inplace=True)
+    pd.testing.assert_frame_equal(api.get_all_yield_series(start, end), expected)
+
+
+def test__get_all_yield_series__cache_is_per_instance(api, stub_fred):
+    """A new API instance does not reuse another instance's cached data."""
+    start, end = datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)
+    api.get_all_yield_series(start, end)
+    other = HistoricalFredDataAPI(fred_api_key="test-key")
+    other.fred = stub_fred
+    other.get_all_yield_series(start, end)
+    assert len(stub_fred.calls) == 2 * len(SERIES_IDS)
+
+
+def test__get_single_series__rejects_unknown_frequency(api):
+    """Frequencies FRED doesn't support are rejected before any request is made."""
+    with pytest.raises(ValueError):
+        api.get_single_series(frequency="x")
+    assert api.fred.calls == []